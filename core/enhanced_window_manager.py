@@ -1,11 +1,15 @@
 # Delta_Mon/core/enhanced_window_manager.py
 
+import logging
 import win32gui
 import win32con
 import win32api
 import time
+from itertools import islice
 from typing import Optional, List, Dict
 
+logger = logging.getLogger(__name__)
+
 
 class EnhancedWindowManager:
     def __init__(self, exclude_title_substring="DeltaMon"):
@@ -25,12 +29,12 @@ class EnhancedWindowManager:
         }
 
     def find_all_tos_windows(self) -> Dict[str, List[Dict]]:
-        print("🔍 Scanning for all Thinkorswim windows (Enhanced)...")
+        logger.debug("🔍 Scanning for all Thinkorswim windows (Enhanced)...")
         all_windows = []
         try:
             win32gui.EnumWindows(self._collect_windows_callback, all_windows)
         except Exception as e:
-            print(f"Error enumerating windows: {e}")
+            logger.error("Error enumerating windows: %s", e)
             return {}
 
         categorized = {
@@ -54,7 +58,7 @@ class EnhancedWindowManager:
                 if category:
                     categorized[category].append(window_info)
 
-        self._print_window_analysis(categorized)
+        self._log_window_analysis(categorized)
         return categorized
 
     def _collect_windows_callback(self, hwnd, windows_list):
@@ -91,16 +95,19 @@ class EnhancedWindowManager:
         # If it contained a core ToS keyword but didn't fit above, it's 'other'
         return 'other_tos'
 
-    def _print_window_analysis(self, categorized: Dict):
+    def _log_window_analysis(self, categorized: Dict):
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         total_tos = sum(len(windows) for windows in categorized.values())
-        print(f"📊 Found {total_tos} ToS-related windows:")
+        logger.debug("📊 Found %d ToS-related windows:", total_tos)
         for category, windows in categorized.items():
             if windows:
-                print(f"   {category.replace('_', ' ').title()}: {len(windows)}")
-                for window in windows[:3]:
-                    print(f"      • '{window['title']}' (HWND: {window['hwnd']})")
-                if len(windows) > 3:
-                    print(f"      ... and {len(windows) - 3} more")
+                count = len(windows)
+                logger.debug("   %s: %d", category.replace('_', ' ').title(), count)
+                logger.debug("\n".join(f"      • '{window['title']}' (HWND: {window['hwnd']})"
+                                       for window in islice(windows, 3)))
+                if count > 3:
+                    logger.debug("      ... and %d more", count - 3)
 
     def _find_main_trading_window(self) -> Optional[int]:
         hwnds = []
@@ -121,23 +128,23 @@ class EnhancedWindowManager:
 
     def get_window_rect(self) -> Optional[tuple]:
         if not self.hwnd:
-            print("No ToS window handle (HWND) available for get_window_rect.")
+            logger.warning("No ToS window handle (HWND) available for get_window_rect.")
             return None
         try:
             return win32gui.GetWindowRect(self.hwnd)
         except Exception as e:
-            print(f"Error getting window rect for HWND {self.hwnd}: {e}")
+            logger.error("Error getting window rect for HWND %s: %s", self.hwnd, e)
             self.hwnd = None
             return None
 
     def focus_tos_window(self) -> bool:
         if not self.hwnd:
-            print("No ToS window handle available for focusing. Finding it first...")
+            logger.debug("No ToS window handle available for focusing. Finding it first...")
             self.hwnd = self._find_main_trading_window()
             if not self.hwnd:
-                print("Focus failed: ToS window could not be found.")
+                logger.warning("Focus failed: ToS window could not be found.")
                 return False
-            print(f"Found ToS window (HWND: {self.hwnd}) for focusing.")
+            logger.debug("Found ToS window (HWND: %s) for focusing.", self.hwnd)
 
         try:
             if win32gui.IsIconic(self.hwnd):
@@ -148,10 +155,10 @@ class EnhancedWindowManager:
             time.sleep(0.2)
 
             if win32gui.GetForegroundWindow() == self.hwnd:
-                print(f"✅ Focused ToS window (HWND: {self.hwnd})")
+                logger.debug("✅ Focused ToS window (HWND: %s)", self.hwnd)
                 return True
             else:
-                print("⚠️ SetForegroundWindow failed. Trying alternative focus...")
+                logger.debug("⚠️ SetForegroundWindow failed. Trying alternative focus...")
                 try:
                     import win32com.client
                     shell = win32com.client.Dispatch("WScript.Shell")
@@ -159,15 +166,15 @@ class EnhancedWindowManager:
                     win32gui.SetForegroundWindow(self.hwnd)
                     time.sleep(0.2)
                     if win32gui.GetForegroundWindow() == self.hwnd:
-                        print("✅ Alternative focus successful.")
+                        logger.debug("✅ Alternative focus successful.")
                         return True
                 except Exception as com_e:
-                    print(f"   Alternative focus error: {com_e}")
+                    logger.warning("Alternative focus error: %s", com_e)
 
-                print(f"❌ Failed to robustly focus ToS window (HWND {self.hwnd}).")
+                logger.warning("❌ Failed to robustly focus ToS window (HWND %s).", self.hwnd)
                 return False
         except Exception as e:
-            print(f"Error focusing ToS window (HWND {self.hwnd}): {e}")
+            logger.error("Error focusing ToS window (HWND %s): %s", self.hwnd, e)
             self.hwnd = None
             return False
 
@@ -176,16 +183,16 @@ class EnhancedWindowManager:
 
     def get_tos_status_report(self) -> Dict:
         categorized = self.find_all_tos_windows()
-        main_available = bool(categorized.get('main_trading'))
-        if main_available:
-            self.hwnd = categorized['main_trading'][0]['hwnd']
+        main_trading = categorized.get('main_trading')
+        if main_trading:
+            self.hwnd = main_trading[0]['hwnd']
 
         return {
-            'main_trading_available': main_available,
+            'main_trading_available': bool(main_trading),
             'launcher_open': bool(categorized.get('launcher')),
             'login_required': bool(categorized.get('login')),
-            'other_tos_windows': len(categorized.get('other_tos', [])),
-            'total_tos_windows': sum(len(windows) for windows in categorized.values()),
+            'other_tos_windows': len(categorized.get('other_tos', ())),
+            'total_tos_windows': sum(map(len, categorized.values())),
             'recommended_action': self._get_recommended_action(categorized)
         }
 
@@ -203,6 +210,7 @@ class EnhancedWindowManager:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
     print("Enhanced ToS Window Manager Test")
     print("=" * 40)
     wm = EnhancedWindowManager()
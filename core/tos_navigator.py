@@ -148,6 +148,30 @@ class TosNavigator:
 
     def find_element_in_upper_left(self, template_filename: str, confidence=0.7, region_width_ratio=0.3,
                                    region_height_ratio=0.15):
+        match = self._match_in_upper_left(template_filename, region_width_ratio, region_height_ratio)
+        if not match:
+            return None
+        max_val, max_loc, template_w, template_h = match
+
+        if max_val >= confidence:
+
+            match_x_relative_to_window = max_loc[0]
+            match_y_relative_to_window = max_loc[1]
+
+            print(
+                f"Found '{template_filename}' in upper-left with confidence {max_val:.2f} at window coords ({match_x_relative_to_window}, {match_y_relative_to_window})")
+            return (match_x_relative_to_window, match_y_relative_to_window, template_w, template_h)
+        else:
+
+            return None
+
+    def score_element_in_upper_left(self, template_filename: str, region_width_ratio=0.3,
+                                    region_height_ratio=0.15) -> float:
+        """Best match score for the template, or 0.0 if it could not be matched at all."""
+        match = self._match_in_upper_left(template_filename, region_width_ratio, region_height_ratio)
+        return match[0] if match else 0.0
+
+    def _match_in_upper_left(self, template_filename: str, region_width_ratio: float, region_height_ratio: float):
         template_path = os.path.join(self.templates_path, template_filename)
         if not os.path.exists(template_path):
             print(f"Template image not found for upper-left search: {template_path}")
@@ -175,18 +199,7 @@ class TosNavigator:
 
         result = cv2.matchTemplate(region_screenshot_cv, template_img, cv2.TM_CCOEFF_NORMED)
         _, max_val, _, max_loc = cv2.minMaxLoc(result)
-
-        if max_val >= confidence:
-
-            match_x_relative_to_window = max_loc[0]
-            match_y_relative_to_window = max_loc[1]
-
-            print(
-                f"Found '{template_filename}' in upper-left with confidence {max_val:.2f} at window coords ({match_x_relative_to_window}, {match_y_relative_to_window})")
-            return (match_x_relative_to_window, match_y_relative_to_window, template_w, template_h)
-        else:
-
-            return None
+        return max_val, max_loc, template_w, template_h
 
     def click_somewhere_else_to_close_dropdown(self):
         window_rect = self._get_window_rect()
@@ -1,7 +1,8 @@
 import sys
 from PySide6.QtWidgets import QApplication, QMenuBar, QMenu
 from PySide6.QtGui import QIcon, QAction
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import Qt, QTimer
+import shiboken6
 from ui.scaled_main_window import OverlayMainWindow  # or OverlayMainWindow
 from utils.auto_updater import AutoUpdater
 import os
@@ -9,6 +10,43 @@ import os
 # DeltaMon Version - UPDATE THIS WHEN RELEASING!
 VERSION = "1.0.1"
 
+# About box, reused until its parent window is replaced or destroyed
+_about_box = None
+
+
+def show_about_dialog(parent):
+    """Show about dialog (built once per window, then reused); window-modal, no nested event loop"""
+    global _about_box
+    from PySide6.QtWidgets import QMessageBox
+
+    if _about_box is not None and shiboken6.isValid(_about_box) and _about_box.parent() is parent:
+        _about_box.open()
+        return
+
+    msg = QMessageBox(parent)
+    msg.setWindowTitle("About DeltaMon")
+    msg.setText(f"""
+<h2>🚀 DeltaMon v{VERSION}</h2>
+<p><b>OptionDelta Monitor for ThinkOrSwim</b></p>
+
+<h3>Features:</h3>
+<ul>
+<li>✅ OptionDelta monitoring</li>
+<li>✅ Account auto-discovery</li>
+<li>✅ Discord/Telegram alerts</li>
+<li>✅ Always-on-top overlay</li>
+<li>✅ Bundled OCR (no setup required)</li>
+<li>✅ Automatic updates</li>
+</ul>
+
+<p><b>GitHub:</b> <a href="https://github.com/carpsesdema/Delta_Mon">carpsesdema/Delta_Mon</a></p>
+<p><b>Built with:</b> PySide6, OpenCV, Tesseract OCR</p>
+""")
+    msg.setTextFormat(Qt.TextFormat.RichText)
+    _about_box = msg
+    msg.open()
+
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setApplicationName("DeltaMon - OptionDelta Monitor")
@@ -74,30 +112,3 @@ if __name__ == "__main__":
     print(f"   🔗 GitHub: https://github.com/carpsesdema/Delta_Mon")
 
     sys.exit(app.exec())
-
-
-def show_about_dialog(parent):
-    """Show about dialog"""
-    from PySide6.QtWidgets import QMessageBox
-
-    msg = QMessageBox(parent)
-    msg.setWindowTitle("About DeltaMon")
-    msg.setText(f"""
-<h2>🚀 DeltaMon v{VERSION}</h2>
-<p><b>OptionDelta Monitor for ThinkOrSwim</b></p>
-
-<h3>Features:</h3>
-<ul>
-<li>✅ OptionDelta monitoring</li>
-<li>✅ Account auto-discovery</li>
-<li>✅ Discord/Telegram alerts</li>
-<li>✅ Always-on-top overlay</li>
-<li>✅ Bundled OCR (no setup required)</li>
-<li>✅ Automatic updates</li>
-</ul>
-
-<p><b>GitHub:</b> <a href="https://github.com/carpsesdema/Delta_Mon">carpsesdema/Delta_Mon</a></p>
-<p><b>Built with:</b> PySide6, OpenCV, Tesseract OCR</p>
-""")
-    msg.setTextFormat(1)  # Rich text
-    msg.exec()
\ No newline at end of file
@@ -0,0 +1,55 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+ACCOUNT_COLUMNS = ("Account", "Status", "Delta", "Check", "Alerts")
+STATUS_COLUMN = 1
+
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_HORIZONTAL = Qt.Orientation.Horizontal
+_READ_ONLY_ITEM_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+_NO_INDEX = QModelIndex()
+
+
+class AccountsTableModel(QAbstractTableModel):
+    """Read-only account rows stored column-wise: one plain list of cell texts per column."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = tuple([] for _ in ACCOUNT_COLUMNS)
+
+    def rowCount(self, parent=_NO_INDEX):
+        return 0 if parent.isValid() else len(self._columns[0])
+
+    def columnCount(self, parent=_NO_INDEX):
+        return 0 if parent.isValid() else len(ACCOUNT_COLUMNS)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if role != _DISPLAY_ROLE or not index.isValid():
+            return None
+        return self._columns[index.column()][index.row()]
+
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == _HORIZONTAL:
+            return ACCOUNT_COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        return _READ_ONLY_ITEM_FLAGS
+
+    def set_rows(self, rows):
+        """Replace every row with a single model reset instead of per-row inserts."""
+        self.beginResetModel()
+        for column_index, column in enumerate(self._columns):
+            column[:] = [cells[column_index] for cells in rows]
+        self.endResetModel()
+
+    def clear(self):
+        self.set_rows(())
+
+    def set_cell(self, row: int, column: int, text: str):
+        """Update one cell, repainting only that cell and only if its text changed."""
+        cells = self._columns[column]
+        if cells[row] == text:
+            return
+        cells[row] = text
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index, [_DISPLAY_ROLE])
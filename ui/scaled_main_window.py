@@ -1,30 +1,111 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QTableWidget, QAbstractItemView,
-    QHeaderView, QLabel, QTableWidgetItem, QApplication,
-    QProgressBar, QTextEdit, QSplitter, QGroupBox, QGridLayout,
-    QSpinBox, QCheckBox, QScrollArea, QFrame, QDialog
+    QPushButton, QTableView, QAbstractItemView,
+    QHeaderView, QLabel, QApplication,
+    QProgressBar, QPlainTextEdit, QSplitter, QGroupBox, QGridLayout,
+    QSpinBox, QCheckBox
 )
-from PySide6.QtCore import Qt, Slot, QTimer, QThread, Signal
-from PySide6.QtGui import QFont, QIcon
+from PySide6.QtCore import Qt, Slot, QTimer, Signal, QEvent, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QIcon, QPalette, QColor
 
+import importlib
+import math
+import re
 import time
 import os
-from datetime import datetime
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
 
 from utils.config_manager import ConfigManager
 from core.enhanced_window_manager import EnhancedWindowManager
 from core.tos_navigator import TosNavigator
+from ui.accounts_table import AccountsTableModel, STATUS_COLUMN
+
+_STRETCH = QHeaderView.ResizeMode.Stretch
+_FIXED = QHeaderView.ResizeMode.Fixed
+_NO_EDIT = QAbstractItemView.EditTrigger.NoEditTriggers
+_SELECT_ROWS = QAbstractItemView.SelectionBehavior.SelectRows
+_HORIZONTAL = Qt.Orientation.Horizontal
+_QUEUED = Qt.ConnectionType.QueuedConnection
+_ELIDE_RIGHT = Qt.TextElideMode.ElideRight
+_OVERLAY_WINDOW_FLAGS = (
+    Qt.WindowType.Window |
+    Qt.WindowType.WindowStaysOnTopHint |
+    Qt.WindowType.WindowCloseButtonHint |
+    Qt.WindowType.WindowMinimizeButtonHint
+)
 
+DROPDOWN_DISCOVERY_MODULE = "core.enhanced_dropdown_reader"
+
+# The new template must match at least as well as click_account_dropdown requires at runtime
+VALIDATION_SUCCESS_CONFIDENCE = 0.7
+VALIDATION_CONFIDENCES = (0.8, 0.7, 0.6, 0.5)
+
+ACCOUNT_STATUS_READY = "Ready"
+DELTA_NOT_AVAILABLE = "N/A"
+LAST_CHECK_NEVER = "Never"
+ALERTS_NONE = "0"
+ACCOUNT_STATUS_MONITORING = "Monitoring"
+
+STATUS_READY = "Status: Ready - Click '🔍 Check ToS Status' to begin"
+STATUS_CHECKING_TOS = "Status: Checking ToS..."
+STATUS_TEMPLATE_SETUP = "Status: Template Setup..."
+STATUS_DISCOVERING = "Status: Discovering Accounts..."
+STATUS_READING_ACCOUNTS = "Status: 🔍 Reading accounts..."
+STATUS_MONITORING_STOPPED = "Status: ⏹️ Monitoring stopped"
+TOS_STATUS_TITLE = "ToS Status"
+
+# (status report key, message, is_error), checked in order; the first truthy key wins
+TOS_STATUS_TABLE = (
+    ('main_trading_available', "Ready for monitoring!", False),
+    ('login_required', "Login required. Please login to ToS.", True),
+    ('launcher_open', "Launcher detected. Please wait for ToS to load.", True),
+    ('other_tos_windows', "Main window not detected", True),
+)
+TOS_NOT_RUNNING_MESSAGE = "ToS not running. Please start ToS."
+
+COUNTDOWN_SECONDS = 10
+COUNTDOWN_STEP_MS = 2000
+COUNTDOWN_PROGRESS_START = 35
+COUNTDOWN_PROGRESS_END = 80
+COUNTDOWN_MESSAGES = tuple(
+    f"   Waiting for click... {seconds}s remaining. (Dropdown should be open and visible)"
+    for seconds in range(COUNTDOWN_SECONDS + 1)
+)
 
-OVERLAY_DARK_STYLE_SHEET = """
-    QWidget {
-        background-color: #1a1a1a;
-        color: #ffffff;
-        font-size: 9pt;
-    }
+LOG_MAX_BLOCKS = 500
+LOG_FLUSH_MS = 100
+SETUP_PROGRESS_HIDE_MS = 2000
+
+STATS_TICK_MS = 5000
+STATS_FAST_TICK_MS = 1000
+FAST_SCAN_INTERVAL_S = 30
+STATS_REFRESH_DEBOUNCE_MS = 50
+
+# step signal progress value meaning "status line only, leave the bar where it is"
+NO_PROGRESS = -1
+
+
+def _minify_qss(qss: str) -> str:
+    """Strip comments and redundant whitespace so Qt's QSS parser has less to tokenize."""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    qss = re.sub(r"\s+", " ", qss)
+    return re.sub(r"\s*([{}:;,])\s*", r"\1", qss).strip()
+
+
+OVERLAY_FONT_POINT_SIZE = 9
+OVERLAY_PALETTE_COLORS = (
+    (QPalette.ColorRole.Window, "#1a1a1a"),
+    (QPalette.ColorRole.Base, "#1a1a1a"),
+    (QPalette.ColorRole.Button, "#1a1a1a"),
+    (QPalette.ColorRole.WindowText, "#ffffff"),
+    (QPalette.ColorRole.Text, "#ffffff"),
+    (QPalette.ColorRole.ButtonText, "#ffffff"),
+)
+
+OVERLAY_DARK_STYLE_SHEET = _minify_qss("""
     QMainWindow {
-        background-color: #1a1a1a;
         border: 2px solid #3498db;
     }
     QPushButton {
@@ -46,42 +127,42 @@ OVERLAY_DARK_STYLE_SHEET = """
         background-color: #2c3e50;
         color: #7f8c8d;
     }
-    QPushButton#setupButton {
+    QPushButton[role="setup"] {
         background-color: #2980b9;
     }
-    QPushButton#setupButton:hover {
+    QPushButton[role="setup"]:hover {
         background-color: #3498db;
     }
-    QPushButton#criticalButton {
+    QPushButton[role="critical"] {
         background-color: #e74c3c;
         font-weight: bold;
     }
-    QPushButton#criticalButton:hover {
+    QPushButton[role="critical"]:hover {
         background-color: #c0392b;
     }
-    QPushButton#warningButton {
+    QPushButton[role="warning"] {
         background-color: #f39c12;
         color: #2c3e50;
         font-weight: bold;
     }
-    QPushButton#warningButton:hover {
+    QPushButton[role="warning"]:hover {
         background-color: #e67e22;
     }
-    QPushButton#successButton {
+    QPushButton[role="success"] {
         background-color: #27ae60;
         font-weight: bold;
     }
-    QPushButton#successButton:hover {
+    QPushButton[role="success"]:hover {
         background-color: #2ecc71;
     }
-    QPushButton#editButton {
+    QPushButton[role="edit"] {
         background-color: #8e44ad;
         font-weight: bold;
     }
-    QPushButton#editButton:hover {
+    QPushButton[role="edit"]:hover {
         background-color: #9b59b6;
     }
-    QTableWidget {
+    QTableView {
         background-color: #2c3e50;
         color: #ffffff;
         gridline-color: #34495e;
@@ -97,11 +178,11 @@ OVERLAY_DARK_STYLE_SHEET = """
         font-weight: bold;
         font-size: 8pt;
     }
-    QTableWidget::item {
+    QTableView::item {
         padding: 2px;
         font-size: 8pt;
     }
-    QTableWidget::item:selected {
+    QTableView::item:selected {
         background-color: #3498db;
         color: #ffffff;
     }
@@ -113,7 +194,7 @@ OVERLAY_DARK_STYLE_SHEET = """
         border-radius: 3px;
         background-color: #2c3e50;
     }
-    QLabel#alertCount {
+    QLabel[alertState="red"] {
         background-color: #e74c3c;
         color: white;
         font-weight: bold;
@@ -121,7 +202,7 @@ OVERLAY_DARK_STYLE_SHEET = """
         border-radius: 8px;
         font-size: 9pt;
     }
-    QLabel#alertCountGreen {
+    QLabel[alertState="green"] {
         background-color: #27ae60;
         color: white;
         font-weight: bold;
@@ -161,7 +242,7 @@ OVERLAY_DARK_STYLE_SHEET = """
         padding: 2px;
         font-size: 8pt;
     }
-    QTextEdit {
+    QTextEdit, QPlainTextEdit {
         background-color: #2c3e50;
         border: 1px solid #34495e;
         border-radius: 3px;
@@ -169,117 +250,261 @@ OVERLAY_DARK_STYLE_SHEET = """
         font-family: 'Consolas', monospace;
         font-size: 8pt;
     }
-"""
+""")
+
+
+def _apply_app_style_sheet():
+    """Set the overlay palette, font and sheet on the QApplication once so Qt parses the
+    sheet a single time and every window/widget inherits them."""
+    app = QApplication.instance()
+    if app is not None and not app.property("overlayStyleApplied"):
+        palette = app.palette()
+        for role, color in OVERLAY_PALETTE_COLORS:
+            palette.setColor(role, QColor(color))
+        app.setPalette(palette)
+        font = app.font()
+        font.setPointSize(OVERLAY_FONT_POINT_SIZE)
+        app.setFont(font)
+        app.setStyleSheet(OVERLAY_DARK_STYLE_SHEET)
+        app.setProperty("overlayStyleApplied", True)
+
+
+# [epoch second, "[HH:MM:SS] "] of the last formatted log line prefix
+_log_prefix_cache = [0, ""]
+
+
+def _log_prefix() -> str:
+    """Return the cached "[HH:MM:SS] " prefix, re-formatted at most once per second."""
+    second = int(time.time())
+    if second != _log_prefix_cache[0]:
+        _log_prefix_cache[0] = second
+        t = time.localtime(second)
+        _log_prefix_cache[1] = f"[{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}] "
+    return _log_prefix_cache[1]
+
+
+class AccountState(Enum):
+    IDLE = "idle"
+    MONITORING = "monitoring"
+
+
+ACCOUNT_STATE_TEXT = {
+    AccountState.IDLE: ACCOUNT_STATUS_READY,
+    AccountState.MONITORING: ACCOUNT_STATUS_MONITORING,
+}
+
+
+@dataclass(slots=True)
+class ScanStats:
+    """Running scan statistics shown in the Stats panel."""
+    total_scans: int = 0
+    successful_scans: int = 0
+    average_scan_time: float = 0.0
+    alerts_today: int = 0
 
 
-class ScaledTemplateSetupWorker(QThread):
-    status_update = Signal(str)
-    progress_update = Signal(int)
-    finished_setup = Signal(bool)
+TASK_POOL_THREADS = 2
+_task_pool_instance = None
 
-    def __init__(self, tos_navigator):
+
+def _task_pool() -> QThreadPool:
+    """Small pool shared by all BackgroundTasks, kept apart from Qt's global pool."""
+    global _task_pool_instance
+    if _task_pool_instance is None:
+        _task_pool_instance = QThreadPool()
+        _task_pool_instance.setMaxThreadCount(TASK_POOL_THREADS)
+    return _task_pool_instance
+
+
+class TaskSignals(QObject):
+    done = Signal(object)
+    failed = Signal(str)
+    progress = Signal(str)
+
+
+class BackgroundTask(QRunnable):
+    """Run one blocking call on the thread pool; its result or traceback comes back as a signal."""
+
+    def __init__(self, fn, *args, **kwargs):
         super().__init__()
+        self.signals = TaskSignals()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+
+    def report_progress_as(self, keyword: str):
+        """Pass signals.progress.emit to the call as the given callback keyword argument."""
+        self._kwargs[keyword] = self.signals.progress.emit
+        return self
+
+    def run(self):
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception:
+            import traceback
+            self.signals.failed.emit(traceback.format_exc())
+        else:
+            self.signals.done.emit(result)
+
+
+class ScaledTemplateSetupWorker(QObject):
+    """Template setup as a chain of timer/pool callbacks on the GUI thread.
+
+    Waits are QTimers rather than sleeps, and only the blocking ToS screen
+    captures and template matching run on a pool thread, so no thread is held
+    for the user countdown.
+    """
+    step = Signal(int, str)  # progress percent (NO_PROGRESS to leave it), status line ("" if none)
+    countdown_tick = Signal(int, int)  # seconds remaining, progress percent
+    finished_setup = Signal(bool, str)  # success, final status line ("" if none)
+
+    capture_width_ratio = 0.4
+    capture_height_ratio = 0.5
+
+    def __init__(self, tos_navigator, parent=None):
+        super().__init__(parent)
         self.tos_navigator = tos_navigator
         if not self.tos_navigator:
             raise ValueError("TosNavigator cannot be None for ScaledTemplateSetupWorker")
+        self._running = False
+        self._task = None
+        self._on_task_done = None
+        self._before_path = None
+        self._countdown_deadline = 0.0
+        self._countdown_timer = QTimer(self)
+        self._countdown_timer.setSingleShot(True)
+        self._countdown_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._countdown_timer.timeout.connect(self._countdown_tick)
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def cancel(self):
+        """Abandon the setup: stop the countdown and ignore whatever the in-flight step returns."""
+        if not self._running:
+            return
+        self._countdown_timer.stop()
+        self._finish(False, "⏹️ Template setup cancelled.")
 
-    def run(self):
-        try:
-            self.status_update.emit("🚀 Starting template setup...")
-            self.progress_update.emit(5)
-
-            if not self.tos_navigator or not self.tos_navigator.hwnd:
-                self.status_update.emit("❌ Critical Error: ToS Navigator not properly initialized or HWND missing.")
-                self.finished_setup.emit(False)
-                return
-
-            capture_width_ratio = 0.4
-            capture_height_ratio = 0.5
-
-            self.status_update.emit(
-                f"ℹ️ Using capture region: {capture_width_ratio * 100:.0f}% width, {capture_height_ratio * 100:.0f}% height of ToS window (upper-left).")
-            self.progress_update.emit(10)
-
-            self.status_update.emit("📸 Capturing initial state (BEFORE your click)...")
-            before_path = self.tos_navigator.capture_upper_left_region(
-                "template_setup_before_click.png",
-                width_ratio=capture_width_ratio,
-                height_ratio=capture_height_ratio
-            )
-            if not before_path:
-                self.status_update.emit(
-                    "❌ Failed to capture 'before click' state. Check ToS window visibility and focus.")
-                self.finished_setup.emit(False)
-                return
-            self.status_update.emit(f"✅ 'Before click' state captured: {os.path.basename(before_path)}")
-            self.progress_update.emit(35)
-
-            self.status_update.emit("‼️ USER ACTION REQUIRED ‼️")
-            self.status_update.emit(
-                "👉 In the ToS window, please CLICK the 'Account: <TOTAL>...' bar (or your account dropdown trigger) NOW!")
-            self.status_update.emit(
-                "⏳ You have 10 seconds. Ensure the account list dropdown EXPANDS and is fully visible.")
-
-            for i in range(10, 0, -1):
-                self.status_update.emit(
-                    f"   Waiting for click... {i}s remaining. (Dropdown should be open and visible)")
-                time.sleep(1)
-                current_progress = 35 + int((10 - i) * 4.5)
-                self.progress_update.emit(current_progress)
-
-            self.status_update.emit("📸 Capturing 'after click' state (dropdown should be open)...")
-            after_path = self.tos_navigator.capture_upper_left_region(
-                "template_setup_after_click.png",
-                width_ratio=capture_width_ratio,
-                height_ratio=capture_height_ratio
-            )
-            if not after_path:
-                self.status_update.emit(
-                    "❌ Failed to capture 'after click' state. Was the dropdown opened and visible within the capture area?")
-                self.finished_setup.emit(False)
-                return
-            self.status_update.emit(f"✅ 'After click' state captured: {os.path.basename(after_path)}")
-            self.progress_update.emit(85)
-
-            self.status_update.emit("🔍 Creating 'account_dropdown_template.png' from difference...")
-            template_created = self.tos_navigator._create_template_from_difference(
-                before_path,
-                after_path,
-                output_template_name="account_dropdown_template.png"
-            )
-
-            if template_created:
-                self.progress_update.emit(95)
-                self.status_update.emit("🧪 Validating new template...")
-                time.sleep(1)
-
-                self.tos_navigator.click_somewhere_else_to_close_dropdown()
-                time.sleep(1.5)
-
-                result = self.tos_navigator.find_element_in_upper_left(
-                    "account_dropdown_template.png",
-                    confidence=0.6,
-                    region_width_ratio=capture_width_ratio,
-                    region_height_ratio=capture_height_ratio
-                )
-                if result:
-                    self.status_update.emit(f"✅ Template validated successfully! Found with test.")
-                else:
-                    self.status_update.emit(
-                        "⚠️ Template created, but initial validation test failed. It might still work with different confidence. Check 'assets/templates/account_dropdown_template.png'.")
-
-                self.progress_update.emit(100)
-                self.finished_setup.emit(True)
-            else:
-                self.status_update.emit(
-                    "❌ Failed to create account dropdown template. Check captured images in 'assets/captures/'. The 'before' and 'after' images should be the same size.")
-                self.finished_setup.emit(False)
+    def start(self):
+        self._running = True
+        self.step.emit(5, "🚀 Starting template setup...")
 
-        except Exception as e:
-            self.status_update.emit(f"❌ Critical error during template setup: {e}")
-            import traceback
-            self.status_update.emit(traceback.format_exc())
-            self.finished_setup.emit(False)
+        if not self.tos_navigator or not self.tos_navigator.hwnd:
+            self._finish(False, "❌ Critical Error: ToS Navigator not properly initialized or HWND missing.")
+            return
+
+        self.step.emit(
+            10, f"ℹ️ Using capture region: {self.capture_width_ratio * 100:.0f}% width, {self.capture_height_ratio * 100:.0f}% height of ToS window (upper-left).")
+
+        self.step.emit(NO_PROGRESS, "📸 Capturing initial state (BEFORE your click)...")
+        self._run_blocking(self._on_before_captured, self.tos_navigator.capture_upper_left_region,
+                           "template_setup_before_click.png",
+                           width_ratio=self.capture_width_ratio, height_ratio=self.capture_height_ratio)
+
+    def _run_blocking(self, on_done, fn, *args, **kwargs):
+        if not self._running:
+            return
+        task = BackgroundTask(fn, *args, **kwargs)
+        task.signals.done.connect(self._task_done, _QUEUED)
+        task.signals.failed.connect(self._on_task_failed, _QUEUED)
+        self._task = task
+        self._on_task_done = on_done
+        _task_pool().start(task)
+
+    @Slot(object)
+    def _task_done(self, result):
+        if self._running:
+            self._on_task_done(result)
+
+    @Slot(str)
+    def _on_task_failed(self, formatted_traceback: str):
+        if not self._running:
+            return
+        self.step.emit(NO_PROGRESS, formatted_traceback)
+        self._finish(False,
+                     f"❌ Critical error during template setup: {formatted_traceback.strip().splitlines()[-1]}")
+
+    def _finish(self, success: bool, message: str = ""):
+        """End the run; the last status line travels with the finished signal instead of separately."""
+        self._task = None
+        self._on_task_done = None
+        self._running = False
+        self.finished_setup.emit(success, message)
+
+    def _on_before_captured(self, before_path):
+        if not before_path:
+            self._finish(False,
+                         "❌ Failed to capture 'before click' state. Check ToS window visibility and focus.")
+            return
+        self.step.emit(COUNTDOWN_PROGRESS_START, f"✅ 'Before click' state captured: {os.path.basename(before_path)}")
+        self._before_path = before_path
+
+        self.step.emit(NO_PROGRESS, "‼️ USER ACTION REQUIRED ‼️")
+        self.step.emit(
+            NO_PROGRESS, "👉 In the ToS window, please CLICK the 'Account: <TOTAL>...' bar (or your account dropdown trigger) NOW!")
+        self.step.emit(
+            NO_PROGRESS, f"⏳ You have {COUNTDOWN_SECONDS} seconds. Ensure the account list dropdown EXPANDS and is fully visible.")
+
+        self._countdown_deadline = time.monotonic() + COUNTDOWN_SECONDS
+        self._countdown_tick()
+
+    def _countdown_tick(self):
+        remaining = self._countdown_deadline - time.monotonic()
+        if remaining > 0:
+            elapsed_fraction = (COUNTDOWN_SECONDS - remaining) / COUNTDOWN_SECONDS
+            self.countdown_tick.emit(round(remaining), COUNTDOWN_PROGRESS_START + int(
+                elapsed_fraction * (COUNTDOWN_PROGRESS_END - COUNTDOWN_PROGRESS_START)))
+            self._countdown_timer.start(math.ceil(min(remaining * 1000, COUNTDOWN_STEP_MS)))
+            return
+
+        self.step.emit(COUNTDOWN_PROGRESS_END, "📸 Capturing 'after click' state (dropdown should be open)...")
+        self._run_blocking(self._on_after_captured, self.tos_navigator.capture_upper_left_region,
+                           "template_setup_after_click.png",
+                           width_ratio=self.capture_width_ratio, height_ratio=self.capture_height_ratio)
+
+    def _on_after_captured(self, after_path):
+        if not after_path:
+            self._finish(False,
+                         "❌ Failed to capture 'after click' state. Was the dropdown opened and visible within the capture area?")
+            return
+        self.step.emit(85, f"✅ 'After click' state captured: {os.path.basename(after_path)}")
+
+        self.step.emit(NO_PROGRESS, "🔍 Creating 'account_dropdown_template.png' from difference...")
+        self._run_blocking(self._on_template_created, self.tos_navigator._create_template_from_difference,
+                           self._before_path, after_path,
+                           output_template_name="account_dropdown_template.png")
+
+    def _on_template_created(self, template_created):
+        if not template_created:
+            self._finish(False,
+                         "❌ Failed to create account dropdown template. Check captured images in 'assets/captures/'. The 'before' and 'after' images should be the same size.")
+            return
+        self.step.emit(95, "🧪 Validating new template...")
+        QTimer.singleShot(1000, self._close_dropdown)
+
+    def _close_dropdown(self):
+        self._run_blocking(self._on_dropdown_closed, self.tos_navigator.click_somewhere_else_to_close_dropdown)
+
+    def _on_dropdown_closed(self, _result):
+        QTimer.singleShot(1500, self._validate_template)
+
+    def _validate_template(self):
+        self._run_blocking(self._on_template_scored, self.tos_navigator.score_element_in_upper_left,
+                           "account_dropdown_template.png",
+                           region_width_ratio=self.capture_width_ratio,
+                           region_height_ratio=self.capture_height_ratio)
+
+    def _on_template_scored(self, score):
+        checks = ", ".join(f"{confidence:.1f} {'✓' if score >= confidence else '✗'}"
+                           for confidence in VALIDATION_CONFIDENCES)
+        self.step.emit(NO_PROGRESS, f"ℹ️ Validation score {score:.2f} ({checks})")
+        if score >= VALIDATION_SUCCESS_CONFIDENCE:
+            self._finish(True,
+                         f"✅ Template validated successfully! Match score {score:.2f} (required {VALIDATION_SUCCESS_CONFIDENCE:.1f}).")
+        else:
+            self._finish(True,
+                         f"⚠️ Template created, but initial validation test failed (score {score:.2f}). It might still work with different confidence. Check 'assets/templates/account_dropdown_template.png'.")
 
 
 class OverlayMainWindow(QMainWindow):
@@ -289,18 +514,13 @@ class OverlayMainWindow(QMainWindow):
         self.setGeometry(50, 50, 900, 600)
 
         # Set always on top and other overlay flags
-        self.setWindowFlags(
-            Qt.WindowType.Window |
-            Qt.WindowType.WindowStaysOnTopHint |
-            Qt.WindowType.WindowCloseButtonHint |
-            Qt.WindowType.WindowMinimizeButtonHint
-        )
+        self.setWindowFlags(_OVERLAY_WINDOW_FLAGS)
 
         icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'assets', 'app_icon.ico')
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
 
-        self.setStyleSheet(OVERLAY_DARK_STYLE_SHEET)
+        _apply_app_style_sheet()
 
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -313,32 +533,64 @@ class OverlayMainWindow(QMainWindow):
         )
         self.tos_navigator = None
         self.discovered_accounts = []
+        self._n_accounts = 0
+        self._account_states = {}
+        self._account_rows = {}
+        self._online_count = 0
+        self._discovering = False
+        self._discovery_task = None
+        self._tos_status_task = None
         self.setup_worker = None
         self.tos_hwnd = None
-
-        self.scan_stats = {
-            'total_scans': 0,
-            'successful_scans': 0,
-            'average_scan_time': 0,
-            'alerts_today': 0
-        }
+        self._pending_setup_lines = []
+        self._pending_setup_progress = None
+        self._label_cache = {}
+        self._stats_dirty = True
+        self._rate_counts = None
+        self._alert_state = "green"
+
+        self.scan_stats = ScanStats()
+
+        self._stats_refresh_timer = QTimer(self)
+        self._stats_refresh_timer.setSingleShot(True)
+        self._stats_refresh_timer.setInterval(STATS_REFRESH_DEBOUNCE_MS)
+        self._stats_refresh_timer.timeout.connect(self._flush_stats)
+
+        self._setup_flush_timer = QTimer(self)
+        self._setup_flush_timer.setSingleShot(True)
+        self._setup_flush_timer.setInterval(LOG_FLUSH_MS)
+        self._setup_flush_timer.timeout.connect(self._flush_setup_updates)
+
+        self._pending_log_lines = deque(maxlen=LOG_MAX_BLOCKS)
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
+        self._progress_hide_timer = QTimer(self)
+        self._progress_hide_timer.setSingleShot(True)
+        self._progress_hide_timer.setInterval(SETUP_PROGRESS_HIDE_MS)
 
         self._setup_ui_elements()
+        self._state_buttons = (self.check_tos_button, self.setup_template_button, self.discover_button,
+                               self.start_button, self.stop_button)
+        self._last_button_states = (None,) * len(self._state_buttons)
         self.update_button_states()
 
-        self.stats_timer = QTimer()
-        self.stats_timer.timeout.connect(self.update_statistics_display)
-        self.stats_timer.start(5000)
+        self.stats_timer = QTimer(self)
+        self.stats_timer.timeout.connect(self._flush_stats)
 
-        self.overall_status_label.setText("Status: Ready - Click '🔍 Check ToS Status' to begin")
+        self._set_label_text(self.overall_status_label, STATUS_READY)
         self.log_monitoring_event("🚀 DeltaMon Overlay ready - Always on top of ToS!")
         self.log_monitoring_event("💡 Please ensure ToS is running and logged in.")
 
+        _task_pool().start(BackgroundTask(importlib.import_module, DROPDOWN_DISCOVERY_MODULE))
+
     def _setup_ui_elements(self):
         control_panel = self.create_control_panel()
         self.main_layout.addWidget(control_panel)
 
-        content_splitter = QSplitter(Qt.Orientation.Horizontal)
+        content_splitter = QSplitter(_HORIZONTAL)
         left_panel = self.create_accounts_panel()
         content_splitter.addWidget(left_panel)
         right_panel = self.create_statistics_panel()
@@ -350,30 +602,28 @@ class OverlayMainWindow(QMainWindow):
         control_frame = QGroupBox("Control Panel")
         control_layout = QVBoxLayout(control_frame)
         main_buttons_layout = QHBoxLayout()
+        main_buttons_layout.setSpacing(10)
 
         self.check_tos_button = QPushButton("🔍 Check ToS Status")
-        self.check_tos_button.setObjectName("successButton")
+        self.check_tos_button.setProperty("role", "success")
         self.check_tos_button.clicked.connect(self.check_tos_status)
         main_buttons_layout.addWidget(self.check_tos_button)
-        main_buttons_layout.addSpacing(5)
 
         self.setup_template_button = QPushButton("🎯 Setup Template")
-        self.setup_template_button.setObjectName("setupButton")
+        self.setup_template_button.setProperty("role", "setup")
         self.setup_template_button.clicked.connect(self.setup_template)
         main_buttons_layout.addWidget(self.setup_template_button)
-        main_buttons_layout.addSpacing(5)
 
         self.discover_button = QPushButton("📋 Read Accounts from Dropdown")
         self.discover_button.clicked.connect(self.discover_accounts)
         main_buttons_layout.addWidget(self.discover_button)
-        main_buttons_layout.addSpacing(10)
 
         self.start_button = QPushButton("🚀 Start Monitoring")
         self.start_button.clicked.connect(self.start_monitoring)
         main_buttons_layout.addWidget(self.start_button)
 
         self.stop_button = QPushButton("⏹️ Stop")
-        self.stop_button.setObjectName("criticalButton")
+        self.stop_button.setProperty("role", "critical")
         self.stop_button.clicked.connect(self.stop_monitoring)
         main_buttons_layout.addWidget(self.stop_button)
         main_buttons_layout.addStretch()
@@ -384,15 +634,11 @@ class OverlayMainWindow(QMainWindow):
         status_layout.addWidget(self.overall_status_label)
         status_layout.addStretch()
         self.alert_count_label = QLabel("0")
-        self.alert_count_label.setObjectName("alertCountGreen")
+        self.alert_count_label.setProperty("alertState", "green")
         self.alert_count_label.setToolTip("Active alerts today")
         status_layout.addWidget(QLabel("Alerts:"))
         status_layout.addWidget(self.alert_count_label)
 
-        self.setup_progress = QProgressBar()
-        self.setup_progress.setVisible(False)
-        self.setup_progress.setRange(0, 100)
-
         settings_layout = QHBoxLayout()
         settings_layout.addWidget(QLabel("Scan:"))
         self.scan_interval_spinner = QSpinBox()
@@ -409,7 +655,10 @@ class OverlayMainWindow(QMainWindow):
 
         control_layout.addLayout(main_buttons_layout)
         control_layout.addLayout(status_layout)
-        control_layout.addWidget(self.setup_progress)
+        # _ensure_setup_progress/_ensure_setup_log insert their lazily built widgets at these indices
+        self._control_layout = control_layout
+        self._setup_progress_index = control_layout.count()
+        self.setup_progress = None
         control_layout.addLayout(settings_layout)
         return control_frame
 
@@ -418,19 +667,25 @@ class OverlayMainWindow(QMainWindow):
         accounts_layout = QVBoxLayout(accounts_frame)
         self.account_count_label = QLabel("No accounts discovered")
         accounts_layout.addWidget(self.account_count_label)
-        self.accounts_table = QTableWidget()
-        self.accounts_table.setColumnCount(5)
-        self.accounts_table.setHorizontalHeaderLabels(["Account", "Status", "Delta", "Check", "Alerts"])
-        self.accounts_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.accounts_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        self.accounts_table.setAlternatingRowColors(True)
+        self.accounts_model = AccountsTableModel(self)
+        self.accounts_table = QTableView()
+        self.accounts_table.setModel(self.accounts_model)
+        self.accounts_table.setEditTriggers(_NO_EDIT)
+        self.accounts_table.setSelectionBehavior(_SELECT_ROWS)
+        self.accounts_table.setAlternatingRowColors(False)
+        self.accounts_model.modelReset.connect(self._sync_alternating_rows)
+        self.accounts_table.setWordWrap(False)
+        self.accounts_table.setTextElideMode(_ELIDE_RIGHT)
         self.accounts_table.verticalHeader().setVisible(False)
+        self.accounts_table.verticalHeader().setSectionResizeMode(_FIXED)
+        self.accounts_table.verticalHeader().setDefaultSectionSize(20)
         header = self.accounts_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(0, _STRETCH)
+        header.setSectionResizeMode(1, _FIXED)
+        header.setSectionResizeMode(2, _FIXED)
+        header.setSectionResizeMode(3, _FIXED)
+        header.setSectionResizeMode(4, _FIXED)
+        self.accounts_table.setColumnWidth(1, 90)
         self.accounts_table.setColumnWidth(2, 60)
         self.accounts_table.setColumnWidth(3, 60)
         self.accounts_table.setColumnWidth(4, 50)
@@ -456,22 +711,48 @@ class OverlayMainWindow(QMainWindow):
         perf_layout.addWidget(self.accounts_online_label, 3, 1)
         stats_layout.addLayout(perf_layout)
 
-        self.setup_log = QTextEdit()
-        self.setup_log.setMaximumHeight(120)
-        self.setup_log.setVisible(False)
-        self.setup_log.setPlaceholderText("Setup log will appear here...")
-        self.setup_log_label = QLabel("Setup Log:")
-        self.setup_log_label.setVisible(False)
-        stats_layout.addWidget(self.setup_log_label)
-        stats_layout.addWidget(self.setup_log)
+        self._stats_layout = stats_layout
+        self._setup_log_index = stats_layout.count()
+        self.setup_log = None
+        self.setup_log_label = None
 
-        self.monitoring_log = QTextEdit()
+        self.monitoring_log = QPlainTextEdit()
+        self.monitoring_log.setReadOnly(True)
+        self.monitoring_log.setUndoRedoEnabled(False)
         self.monitoring_log.setMaximumHeight(120)
         self.monitoring_log.setPlaceholderText("Monitoring events will appear here...")
+        self.monitoring_log.setMaximumBlockCount(LOG_MAX_BLOCKS)
         stats_layout.addWidget(QLabel("Monitor Log:"))
         stats_layout.addWidget(self.monitoring_log)
         return stats_frame
 
+    def _set_label_text(self, label: QLabel, text: str):
+        """setText only when the text differs from what this label last showed."""
+        if self._label_cache.get(label) != text:
+            label.setText(text)
+            self._label_cache[label] = text
+
+    def _ensure_setup_log(self) -> QPlainTextEdit:
+        if self.setup_log is None:
+            self.setup_log_label = QLabel("Setup Log:")
+            self.setup_log = QPlainTextEdit()
+            self.setup_log.setReadOnly(True)
+            self.setup_log.setUndoRedoEnabled(False)
+            self.setup_log.setMaximumHeight(120)
+            self.setup_log.setPlaceholderText("Setup log will appear here...")
+            self.setup_log.setMaximumBlockCount(LOG_MAX_BLOCKS)
+            self._stats_layout.insertWidget(self._setup_log_index, self.setup_log_label)
+            self._stats_layout.insertWidget(self._setup_log_index + 1, self.setup_log)
+        return self.setup_log
+
+    def _ensure_setup_progress(self) -> QProgressBar:
+        if self.setup_progress is None:
+            self.setup_progress = QProgressBar()
+            self.setup_progress.setRange(0, 100)
+            self._control_layout.insertWidget(self._setup_progress_index, self.setup_progress)
+            self._progress_hide_timer.timeout.connect(self.setup_progress.hide)
+        return self.setup_progress
+
     def show_status_message(self, title: str, message: str, is_error: bool = False):
         """Replace popup dialogs with log messages"""
         emoji = "❌" if is_error else "ℹ️"
@@ -480,50 +761,55 @@ class OverlayMainWindow(QMainWindow):
 
         # Also update status label for important messages
         if is_error:
-            self.overall_status_label.setText(f"Status: ❌ {title}")
+            self._set_label_text(self.overall_status_label, f"Status: ❌ {title}")
         else:
-            self.overall_status_label.setText(f"Status: ✅ {title}")
+            self._set_label_text(self.overall_status_label, f"Status: ✅ {title}")
 
     @Slot()
     def check_tos_status(self):
         self.log_monitoring_event("🔍 Checking Thinkorswim status...")
-        self.overall_status_label.setText("Status: Checking ToS...")
-        QApplication.processEvents()
-        status_report = self.window_manager.get_tos_status_report()
-
-        if status_report['main_trading_available']:
-            self.show_status_message("ToS Status", "Ready for monitoring!")
-            self.tos_hwnd = self.window_manager.hwnd
-            tos_is_ready = True
-        elif status_report['login_required']:
-            self.show_status_message("ToS Status", "Login required. Please login to ToS.", True)
-            tos_is_ready = False
-        elif status_report['launcher_open']:
-            self.show_status_message("ToS Status", "Launcher detected. Please wait for ToS to load.", True)
-            tos_is_ready = False
-        elif status_report['other_tos_windows'] > 0:
-            self.show_status_message("ToS Status", "Main window not detected", True)
-            tos_is_ready = False
+        self._set_label_text(self.overall_status_label, STATUS_CHECKING_TOS)
+
+        task = BackgroundTask(self.window_manager.get_tos_status_report)
+        task.signals.done.connect(self._on_tos_status_ready, _QUEUED)
+        task.signals.failed.connect(self._on_tos_status_failed, _QUEUED)
+        self._tos_status_task = task
+        _task_pool().start(task)
+
+    @Slot(object)
+    def _on_tos_status_ready(self, status_report):
+        self._tos_status_task = None
+        for key, message, is_error in TOS_STATUS_TABLE:
+            if status_report.get(key):
+                break
         else:
-            self.show_status_message("ToS Status", "ToS not running. Please start ToS.", True)
-            tos_is_ready = False
+            message, is_error = TOS_NOT_RUNNING_MESSAGE, True
+        self.show_status_message(TOS_STATUS_TITLE, message, is_error)
+        tos_is_ready = not is_error
+        if tos_is_ready:
+            self.tos_hwnd = self.window_manager.hwnd
 
-        self.log_monitoring_event(f"📊 ToS Status: {status_report['recommended_action']}")
+        self.log_monitoring_event(f"📊 ToS Status: {status_report.get('recommended_action', '')}")
         self.update_button_states(tos_ready=tos_is_ready)
 
+    @Slot(str)
+    def _on_tos_status_failed(self, error: str):
+        self._tos_status_task = None
+        error = error.strip().rsplit("\n", 1)[-1]
+        self.show_status_message(TOS_STATUS_TITLE, error, True)
+        self.log_monitoring_event(f"❌ ToS status check error: {error}")
+        self.update_button_states(tos_ready=False)
+
     @Slot()
     def setup_template(self):
         self.log_monitoring_event("🎯 Initiating template setup...")
-        self.overall_status_label.setText("Status: Template Setup...")
-        QApplication.processEvents()
+        self._set_label_text(self.overall_status_label, STATUS_TEMPLATE_SETUP)
+        self.overall_status_label.repaint()
 
         if not self.tos_hwnd:
-            self.log_monitoring_event("⚠️ ToS HWND not confirmed. Running 'Check Status' first...")
-            self.check_tos_status()
-            if not self.tos_hwnd:
-                self.show_status_message("Setup Failed", "ToS Not Ready", True)
-                return
-            self.log_monitoring_event(f"✅ ToS HWND confirmed: {self.tos_hwnd}. Proceeding with template setup.")
+            self.log_monitoring_event("⚠️ ToS HWND not confirmed. Run 'Check Status' first.")
+            self.show_status_message("Setup Failed", "ToS Not Ready", True)
+            return
 
         if not self.tos_navigator:
             self.tos_navigator = TosNavigator(self.tos_hwnd)
@@ -532,18 +818,21 @@ class OverlayMainWindow(QMainWindow):
         if not self.window_manager.focus_tos_window():
             self.log_monitoring_event("⚠️ Could not focus ToS window. Template setup might be unreliable.")
 
+        self._progress_hide_timer.stop()
+        self._ensure_setup_progress().setValue(0)
         self.setup_progress.setVisible(True)
+        self._ensure_setup_log().clear()
         self.setup_log_label.setVisible(True)
         self.setup_log.setVisible(True)
-        self.setup_log.clear()
-        self.update_button_states(setting_up_template=True)
-
+        if self.setup_worker is not None:
+            self.setup_worker.deleteLater()
         try:
-            self.setup_worker = ScaledTemplateSetupWorker(self.tos_navigator)
-            self.setup_worker.status_update.connect(self.on_setup_status_update)
-            self.setup_worker.progress_update.connect(self.on_setup_progress_update)
+            self.setup_worker = ScaledTemplateSetupWorker(self.tos_navigator, self)
+            self.setup_worker.step.connect(self.on_setup_step)
+            self.setup_worker.countdown_tick.connect(self.on_setup_countdown_tick)
             self.setup_worker.finished_setup.connect(self.on_setup_finished)
             self.setup_worker.start()
+            self.update_button_states(setting_up_template=True)
         except ValueError as ve:
             self.log_monitoring_event(f"❌ ERROR starting template setup worker: {ve}")
             self.show_status_message("Setup Error", str(ve), True)
@@ -552,15 +841,13 @@ class OverlayMainWindow(QMainWindow):
     @Slot()
     def discover_accounts(self):
         self.log_monitoring_event("🔍 Starting dropdown-based discovery for all accounts...")
-        self.overall_status_label.setText("Status: Discovering Accounts...")
-        QApplication.processEvents()
+        self._set_label_text(self.overall_status_label, STATUS_DISCOVERING)
+        self.overall_status_label.repaint()
 
         if not self.tos_hwnd:
-            self.log_monitoring_event("⚠️ ToS HWND not confirmed for discovery. Running 'Check Status' first...")
-            self.check_tos_status()
-            if not self.tos_hwnd:
-                self.show_status_message("Discovery Failed", "ToS Not Ready", True)
-                return
+            self.log_monitoring_event("⚠️ ToS HWND not confirmed for discovery. Run 'Check Status' first.")
+            self.show_status_message("Discovery Failed", "ToS Not Ready", True)
+            return
 
         if not self.tos_navigator:
             self.tos_navigator = TosNavigator(self.tos_hwnd)
@@ -569,80 +856,155 @@ class OverlayMainWindow(QMainWindow):
         if not self.window_manager.focus_tos_window():
             self.log_monitoring_event("⚠️ Could not focus ToS window for account discovery. Proceeding with caution.")
 
-        self.accounts_table.setRowCount(0)
+        self.accounts_model.clear()
         self.discovered_accounts = []
-        self.update_button_states(discovering_accounts=True)
-        self.overall_status_label.setText("Status: 🔍 Reading accounts...")
-        QApplication.processEvents()
+        self._n_accounts = 0
+        self._account_states = {}
+        self._account_rows = {}
+        self._online_count = 0
+        self._discovering = True
+        self.update_button_states()
+        self._set_label_text(self.overall_status_label, STATUS_READING_ACCOUNTS)
 
         try:
             from core.enhanced_dropdown_reader import DropdownAccountDiscovery
             dropdown_discovery = DropdownAccountDiscovery(self.tos_navigator)
-
-            def status_update_for_discovery(message):
-                self.overall_status_label.setText(f"Discovery: {message}")
-                self.log_monitoring_event(f"[Discovery] {message}")
-                QApplication.processEvents()
-
-            discovered_account_names = dropdown_discovery.discover_all_accounts(
-                status_callback=status_update_for_discovery)
-
-            if discovered_account_names:
-                for account_name in discovered_account_names:
-                    self.add_account_to_table(account_name, "Ready", "N/A", "Never", "0")
-                    self.discovered_accounts.append(account_name)
-                total_found = len(discovered_account_names)
-                self.account_count_label.setText(f"📊 {total_found} accounts discovered")
-                self.show_status_message("Discovery Success", f"Found {total_found} accounts")
-                self.log_monitoring_event(f"✅ Dropdown discovery successful! Found {total_found} accounts.")
-            else:
-                self.account_count_label.setText("❌ No accounts discovered")
-                self.show_status_message("Discovery Failed", "No accounts found", True)
-                self.log_monitoring_event(
-                    "❌ Dropdown-based discovery failed. Check debug images in assets/captures/dropdown.")
         except Exception as e:
-            error_msg = f"❌ Discovery error: {e}"
-            self.account_count_label.setText("❌ Discovery error")
-            self.show_status_message("Discovery Error", str(e), True)
-            self.log_monitoring_event(error_msg)
-        finally:
-            self.update_button_states(tos_ready=bool(self.tos_hwnd))
+            self._on_discovery_failed(str(e))
+            return
+        task = BackgroundTask(dropdown_discovery.discover_all_accounts).report_progress_as("status_callback")
+        task.signals.progress.connect(self._on_discovery_status, _QUEUED)
+        task.signals.done.connect(self._on_accounts_discovered, _QUEUED)
+        task.signals.failed.connect(self._on_discovery_failed, _QUEUED)
+        self._discovery_task = task
+        _task_pool().start(task)
 
-    def add_account_to_table(self, account_name: str, status: str, delta: str, last_check: str, alerts: str):
-        row_position = self.accounts_table.rowCount()
-        self.accounts_table.insertRow(row_position)
-        self.accounts_table.setItem(row_position, 0, QTableWidgetItem(account_name))
-        self.accounts_table.setItem(row_position, 1, QTableWidgetItem(status))
-        self.accounts_table.setItem(row_position, 2, QTableWidgetItem(delta))
-        self.accounts_table.setItem(row_position, 3, QTableWidgetItem(last_check))
-        self.accounts_table.setItem(row_position, 4, QTableWidgetItem(alerts))
+    @Slot(str)
+    def _on_discovery_status(self, message: str):
+        self._set_label_text(self.overall_status_label, f"Discovery: {message}")
+        self.log_monitoring_event(f"[Discovery] {message}")
+
+    @Slot(object)
+    def _on_accounts_discovered(self, discovered_account_names):
+        if discovered_account_names:
+            self.accounts_model.set_rows(
+                [(account_name, ACCOUNT_STATUS_READY, DELTA_NOT_AVAILABLE, LAST_CHECK_NEVER, ALERTS_NONE)
+                 for account_name in discovered_account_names])
+            self._account_rows = {account_name: row for row, account_name in enumerate(discovered_account_names)}
+            self.discovered_accounts.extend(discovered_account_names)
+            total_found = len(discovered_account_names)
+            self._n_accounts += total_found
+            self.account_count_label.setText(f"📊 {total_found} accounts discovered")
+            self.show_status_message("Discovery Success", f"Found {total_found} accounts")
+            self.log_monitoring_event(f"✅ Dropdown discovery successful! Found {total_found} accounts.")
+        else:
+            self.account_count_label.setText("❌ No accounts discovered")
+            self.show_status_message("Discovery Failed", "No accounts found", True)
+            self.log_monitoring_event(
+                "❌ Dropdown-based discovery failed. Check debug images in assets/captures/dropdown.")
+        self._finish_discovery()
+
+    @Slot(str)
+    def _on_discovery_failed(self, error: str):
+        error = error.strip().rsplit("\n", 1)[-1]
+        self.account_count_label.setText("❌ Discovery error")
+        self.show_status_message("Discovery Error", error, True)
+        self.log_monitoring_event(f"❌ Discovery error: {error}")
+        self._finish_discovery()
+
+    def _finish_discovery(self):
+        self._discovering = False
+        self._discovery_task = None
+        self.update_button_states(tos_ready=bool(self.tos_hwnd))
+
+    @Slot()
+    def _sync_alternating_rows(self):
+        has_rows = self.accounts_model.rowCount() > 0
+        if self.accounts_table.alternatingRowColors() != has_rows:
+            self.accounts_table.setAlternatingRowColors(has_rows)
 
     def log_monitoring_event(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        self.monitoring_log.append(formatted_message)
-        scrollbar = self.monitoring_log.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self._pending_log_lines.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        if self._pending_log_lines:
+            prefix = _log_prefix()
+            self.monitoring_log.appendPlainText("\n".join(prefix + message for message in self._pending_log_lines))
+            self._pending_log_lines.clear()
 
     def update_statistics_display(self):
-        self.total_scans_label.setText(str(self.scan_stats['total_scans']))
-        if self.scan_stats['total_scans'] > 0 and self.scan_stats['successful_scans'] > 0:
-            success_rate = (self.scan_stats['successful_scans'] / self.scan_stats['total_scans']) * 100
-            self.success_rate_label.setText(f"{success_rate:.1f}%")
-        else:
-            self.success_rate_label.setText("0.0%")
-        self.avg_scan_time_label.setText(f"{self.scan_stats['average_scan_time']:.1f}s")
-        online_accounts = 0
-        total_accounts = len(self.discovered_accounts)
-        self.accounts_online_label.setText(f"{online_accounts}/{total_accounts}")
-        self.alert_count_label.setText(str(self.scan_stats['alerts_today']))
-        self.alert_count_label.setObjectName(
-            "alertCountGreen" if self.scan_stats['alerts_today'] == 0 else "alertCount")
-        self.alert_count_label.setStyleSheet(self.styleSheet())
+        """Mark the stats changed and schedule a refresh; bursts of calls are coalesced into one _flush_stats."""
+        self._stats_dirty = True
+        if not self._stats_refresh_timer.isActive():
+            self._stats_refresh_timer.start()
+
+    def _flush_stats(self):
+        if not self._stats_dirty or self.isMinimized() or not self.total_scans_label.isVisible():
+            return
+        self._stats_dirty = False
+        stats = self.scan_stats
+        self._set_label_text(self.total_scans_label, str(stats.total_scans))
+        rate_counts = (stats.total_scans, stats.successful_scans)
+        if rate_counts != self._rate_counts:
+            self._rate_counts = rate_counts
+            if stats.total_scans > 0 and stats.successful_scans > 0:
+                success_rate = (stats.successful_scans / stats.total_scans) * 100
+                self._set_label_text(self.success_rate_label, f"{success_rate:.1f}%")
+            else:
+                self._set_label_text(self.success_rate_label, "0.0%")
+        self._set_label_text(self.avg_scan_time_label, f"{stats.average_scan_time:.1f}s")
+        online_accounts = self._online_count
+        total_accounts = self._n_accounts
+        self._set_label_text(self.accounts_online_label, f"{online_accounts}/{total_accounts}")
+        self._set_label_text(self.alert_count_label, str(stats.alerts_today))
+        alert_state = "green" if stats.alerts_today == 0 else "red"
+        if alert_state != self._alert_state:
+            self._alert_state = alert_state
+            self.alert_count_label.setProperty("alertState", alert_state)
+            style = self.alert_count_label.style()
+            style.unpolish(self.alert_count_label)
+            style.polish(self.alert_count_label)
+
+    def closeEvent(self, event):
+        if self.setup_worker is not None:
+            self.setup_worker.cancel()
+        _task_pool().clear()
+        super().closeEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._stats_dirty:
+            self.update_statistics_display()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and self._stats_dirty and not self.isMinimized():
+            self.update_statistics_display()
+
+    def _set_account_state(self, account_name: str, state: AccountState):
+        """Record an account's state, keeping the online (monitoring) count in step with transitions."""
+        previous = self._account_states.get(account_name, AccountState.IDLE)
+        if previous is state:
+            return
+        self._account_states[account_name] = state
+        if previous is AccountState.MONITORING:
+            self._online_count -= 1
+        elif state is AccountState.MONITORING:
+            self._online_count += 1
+        row = self._account_rows.get(account_name)
+        if row is not None:
+            self.update_cell(row, STATUS_COLUMN, ACCOUNT_STATE_TEXT[state])
+
+    def update_cell(self, row: int, column: int, text: str):
+        """Change one account cell in place; only that cell is repainted."""
+        self.accounts_model.set_cell(row, column, text)
 
     @Slot()
     def start_monitoring(self):
-        account_count = len(self.discovered_accounts)
+        assert self._n_accounts == len(self.discovered_accounts), "account counter drifted"
+        account_count = self._n_accounts
         if account_count == 0:
             self.show_status_message("Start Failed", "No accounts discovered", True)
             return
@@ -651,56 +1013,85 @@ class OverlayMainWindow(QMainWindow):
         self.update_button_states(monitoring_active=True)
         scan_interval = self.scan_interval_spinner.value()
         fast_mode = self.fast_mode_checkbox.isChecked()
-        self.overall_status_label.setText(f"Status: 🚀 Monitoring {account_count} accounts")
+        self._set_label_text(self.overall_status_label, f"Status: 🚀 Monitoring {account_count} accounts")
         mode_text = "Fast Mode" if fast_mode else "Standard Mode"
         self.log_monitoring_event(f"🚀 Started monitoring {account_count} accounts - {mode_text}")
         self.log_monitoring_event(f"⚙️ Scan interval: {scan_interval}s")
+        self.stats_timer.start(STATS_FAST_TICK_MS if scan_interval < FAST_SCAN_INTERVAL_S else STATS_TICK_MS)
+        for account_name in self.discovered_accounts:
+            self._set_account_state(account_name, AccountState.MONITORING)
+        self.update_statistics_display()
 
     @Slot()
     def stop_monitoring(self):
         self._monitoring_active = False
         self.update_button_states(monitoring_active=False)
-        self.overall_status_label.setText("Status: ⏹️ Monitoring stopped")
+        self._set_label_text(self.overall_status_label, STATUS_MONITORING_STOPPED)
         self.log_monitoring_event("⏹️ Monitoring stopped")
+        self.stats_timer.stop()
+        for account_name in self.discovered_accounts:
+            self._set_account_state(account_name, AccountState.IDLE)
+        self.update_statistics_display()
 
-    def update_button_states(self, monitoring_active=None, tos_ready=None, setting_up_template=False,
-                             discovering_accounts=False):
-        if monitoring_active is None:
-            self._monitoring_active = self._monitoring_active
-        else:
+    def update_button_states(self, monitoring_active=None, tos_ready=None, setting_up_template=False):
+        if monitoring_active is not None:
             self._monitoring_active = monitoring_active
 
-        if tos_ready is None: tos_ready = bool(self.tos_hwnd)
-
-        setup_worker_active = self.setup_worker and self.setup_worker.isRunning()
+        tos_ready = bool(self.tos_hwnd) if tos_ready is None else bool(tos_ready)
 
-        self.check_tos_button.setEnabled(not self._monitoring_active and not setup_worker_active)
-        self.setup_template_button.setEnabled(
-            not self._monitoring_active and tos_ready and not setup_worker_active and not discovering_accounts)
-        self.discover_button.setEnabled(
-            not self._monitoring_active and tos_ready and not setup_worker_active and not setting_up_template)
-        can_start_monitoring = bool(self.discovered_accounts) and tos_ready
-        self.start_button.setEnabled(
-            not self._monitoring_active and can_start_monitoring and not setup_worker_active and not setting_up_template and not discovering_accounts)
-        self.stop_button.setEnabled(self._monitoring_active)
+        setup_worker_active = self.setup_worker is not None and self.setup_worker.is_running()
+        discovering_accounts = self._discovering
 
-
-    @Slot(str)
-    def on_setup_status_update(self, message):
-        self.overall_status_label.setText(f"Template Setup: {message}")
-        self.setup_log.append(f"[Setup] {message}")
-        scrollbar = self.setup_log.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
-        QApplication.processEvents()
-
-    @Slot(int)
-    def on_setup_progress_update(self, value):
-        self.setup_progress.setValue(value)
-        QApplication.processEvents()
-
-    @Slot(bool)
-    def on_setup_finished(self, success):
-        QTimer.singleShot(2000, lambda: self.setup_progress.setVisible(False))
+        can_start_monitoring = self._n_accounts > 0 and tos_ready
+        button_states = (
+            not self._monitoring_active and not setup_worker_active and not discovering_accounts,
+            not self._monitoring_active and tos_ready and not setup_worker_active and not discovering_accounts,
+            not self._monitoring_active and tos_ready and not setup_worker_active and not setting_up_template and not discovering_accounts,
+            not self._monitoring_active and can_start_monitoring and not setup_worker_active and not setting_up_template and not discovering_accounts,
+            self._monitoring_active,
+        )
+        if button_states == self._last_button_states:
+            return
+        for button, enabled, last_enabled in zip(self._state_buttons, button_states, self._last_button_states):
+            if enabled != last_enabled:
+                button.setEnabled(enabled)
+        self._last_button_states = button_states
+
+
+    @Slot(int, str)
+    def on_setup_step(self, progress, message):
+        if progress != NO_PROGRESS:
+            self._pending_setup_progress = progress
+        if message:
+            self._pending_setup_lines.append(message)
+        if not self._setup_flush_timer.isActive():
+            self._setup_flush_timer.start()
+
+    @Slot(int, int)
+    def on_setup_countdown_tick(self, remaining_seconds, progress):
+        self._pending_setup_lines.append(COUNTDOWN_MESSAGES[remaining_seconds])
+        self._pending_setup_progress = progress
+        if not self._setup_flush_timer.isActive():
+            self._setup_flush_timer.start()
+
+    def _flush_setup_updates(self):
+        if self._pending_setup_progress is not None:
+            self._ensure_setup_progress().setValue(self._pending_setup_progress)
+            self._pending_setup_progress = None
+        if not self._pending_setup_lines:
+            return
+        lines, self._pending_setup_lines = self._pending_setup_lines, []
+        self._set_label_text(self.overall_status_label, f"Template Setup: {lines[-1]}")
+        self._ensure_setup_log().appendPlainText("\n".join(f"[Setup] {line}" for line in lines))
+
+    @Slot(bool, str)
+    def on_setup_finished(self, success, message):
+        if message:
+            self._pending_setup_lines.append(message)
+        if success:
+            self._pending_setup_progress = 100
+        self._flush_setup_updates()
+        self._progress_hide_timer.start()
         if success:
             self.show_status_message("Template Setup Complete", "Ready for account discovery!")
             self.log_monitoring_event("✅ Template setup completed - Ready for account discovery!")